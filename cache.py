@@ -0,0 +1,56 @@
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+# The cache is optional: without REDIS_URL every lookup misses and
+# requests fall through to the database.
+redis_client = None
+if REDIS_URL:
+    from redis import asyncio as aioredis
+
+    redis_client = aioredis.from_url(REDIS_URL)
+
+TASK_LIST_TTL = 30  # seconds
+_TASK_FILTERS = ("all", "pending", "completed")
+
+
+def task_list_key(user_id: str, filter_status: str) -> str:
+    """Cache key for a user's task list"""
+    return f"tasks:{user_id}:{filter_status}"
+
+
+async def get_cached(key: str) -> Optional[bytes]:
+    """Fetch a cached payload; cache errors behave like a miss"""
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except Exception:
+        return None
+
+
+async def set_cached(key: str, payload: str, ttl: int = TASK_LIST_TTL):
+    """Store a payload with a TTL, ignoring cache errors"""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, payload, ex=ttl)
+    except Exception:
+        pass
+
+
+async def invalidate_task_lists(user_id: str):
+    """Drop every cached task list for a user after a mutation"""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.delete(
+            *(task_list_key(user_id, f) for f in _TASK_FILTERS)
+        )
+    except Exception:
+        pass
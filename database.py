@@ -1,4 +1,7 @@
-from sqlmodel import create_engine, SQLModel, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 import os
 from dotenv import load_dotenv
 
@@ -16,16 +19,39 @@ if DATABASE_URL.startswith("postgres://"):
 elif DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
 
-# Create engine
-engine = create_engine(DATABASE_URL, echo=True)
-
-
-def create_db_and_tables():
+# Create async engine with an explicit connection pool so DB I/O doesn't
+# block the event loop and stale pooled connections get recycled.
+# SQL statement logging is off by default (it costs a log call plus
+# parameter repr per query); set SQL_ECHO=1 to enable it for debugging.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=os.getenv("SQL_ECHO") == "1",
+    echo_pool=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # Room for every statement variant without evictions (default 500).
+    query_cache_size=1200,
+)
+
+# expire_on_commit=False keeps committed objects usable without an
+# implicit refresh query after every commit.
+async_session_factory = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+async def create_db_and_tables():
     """Create all tables in the database"""
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
 
-def get_session():
+async def get_session():
     """Get database session - used as FastAPI dependency"""
-    with Session(engine) as session:
+    async with async_session_factory() as session:
         yield session
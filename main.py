@@ -1,5 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from middleware.auth import JWTAuthMiddleware
 from routes import tasks
 from database import create_db_and_tables
 import os
@@ -14,21 +16,31 @@ app = FastAPI(
     description="RESTful API for Todo application with multi-user support",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson serializes responses (incl. datetimes) in C instead of
+    # the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
-# CORS configuration
-cors_origins = [
+# JWT verification for all /api/ routes. Added before CORS so CORS
+# ends up outermost and its headers are applied to 401 responses too.
+app.add_middleware(JWTAuthMiddleware, prefix="/api/")
+
+# CORS configuration: deduplicated origins, explicit methods/headers
+# (no wildcard expansion per preflight), and max_age so browsers cache
+# preflight responses for a day instead of re-sending OPTIONS.
+cors_origins = list(dict.fromkeys(
     origin.strip()
     for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
     if origin.strip()
-]
+))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
 # Include routers
@@ -36,9 +48,13 @@ app.include_router(tasks.router, prefix="/api", tags=["tasks"])
 
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     """Create database tables on startup"""
-    create_db_and_tables()
+    # create_all is idempotent, but with multiple workers every process
+    # runs it against the same database; set AUTO_CREATE_TABLES=0 when
+    # schema management happens out of band (e.g. migrations).
+    if os.getenv("AUTO_CREATE_TABLES", "1") == "1":
+        await create_db_and_tables()
 
 
 @app.get("/")
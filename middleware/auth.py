@@ -1,41 +1,71 @@
-from fastapi import Request, HTTPException, status
+import json
 from utils.jwt import verify_jwt
 
 
-async def verify_jwt_middleware(request: Request):
+class JWTAuthMiddleware:
     """
-    Middleware to verify JWT token in Authorization header
+    Pure ASGI middleware that verifies the JWT for API requests
 
-    Args:
-        request: FastAPI request object
-
-    Raises:
-        HTTPException: If token is missing, invalid, or expired
+    Runs directly on the ASGI scope for paths under the configured
+    prefix, skipping FastAPI's per-route dependency machinery. On
+    success the token's claims are written into scope["state"], so
+    handlers keep reading them via request.state as before.
     """
-    auth_header = request.headers.get("Authorization")
-
-    if not auth_header:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing Authorization header"
-        )
-
-    parts = auth_header.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid Authorization header format. Expected: Bearer <token>"
-        )
-
-    token = parts[1]
-    payload = verify_jwt(token)
-
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token"
-        )
-
-    # Attach user info to request state
-    request.state.user_id = payload.get("sub")
-    request.state.user_email = payload.get("email")
+
+    def __init__(self, app, prefix: str = "/api/"):
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+
+        # CORS preflights carry no Authorization header
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+                break
+
+        if auth_header is None:
+            await self._unauthorized(send, "Missing Authorization header")
+            return
+
+        parts = auth_header.split()
+        if len(parts) != 2 or parts[0].lower() != b"bearer":
+            await self._unauthorized(
+                send, "Invalid Authorization header format. Expected: Bearer <token>"
+            )
+            return
+
+        payload = verify_jwt(parts[1].decode("latin-1"))
+
+        if not payload:
+            await self._unauthorized(send, "Invalid or expired token")
+            return
+
+        # Attach user info to request state
+        state = scope.setdefault("state", {})
+        state["user_id"] = payload.get("sub")
+        state["user_email"] = payload.get("email")
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _unauthorized(send, detail: str):
+        """Send a 401 response matching HTTPException's JSON shape"""
+        body = json.dumps({"detail": detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,3 +1,4 @@
+from sqlalchemy import Column, DateTime, Index, func, text
 from sqlmodel import SQLModel, Field
 from datetime import datetime
 from typing import Optional
@@ -13,12 +14,35 @@ class AuthUser(SQLModel, table=True):
 class Task(SQLModel, table=True):
     """Task model for todo items"""
     __tablename__ = "tasks"
+    # Composite index matching the list query: filter on user_id (and
+    # optionally completed), order by id DESC to match the keyset
+    # pagination cursor. Covers plain user_id lookups too, so no
+    # separate user_id index is needed.
+    __table_args__ = (
+        Index(
+            "ix_tasks_user_completed_id",
+            "user_id",
+            "completed",
+            text("id DESC"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     # Better Auth uses "user" table; keep FK aligned with auth DB.
-    user_id: str = Field(foreign_key="user.id", index=True)
+    user_id: str = Field(foreign_key="user.id")
     title: str = Field(max_length=200)
     description: Optional[str] = None
     completed: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Timestamps are set by the database, not per-request in Python;
+    # onupdate keeps updated_at fresh on every UPDATE.
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        )
+    )
@@ -1,75 +1,132 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Request
+from sqlalchemy import bindparam, delete, func, insert, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
+from cache import get_cached, set_cached, invalidate_task_lists, task_list_key
 from database import get_session
 from models import Task
-from schemas import TaskCreate, TaskUpdate, TaskResponse, ApiResponse
-from middleware.auth import verify_jwt_middleware
-from datetime import datetime
+from schemas import TaskCreate, TaskUpdate, TaskResponse, TaskFilter
+from pydantic import TypeAdapter
+import orjson
 
 router = APIRouter()
 
+# Reusable adapters so serialization is one Rust-side pass instead of
+# a per-row model_validate + model_dump round-trip.
+_TASK_ADAPTER = TypeAdapter(TaskResponse)
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+
+# The listing hot path fetches plain columns instead of Task
+# instances: no identity-map bookkeeping or per-row ORM state, just
+# Row tuples that serialize straight to dicts.
+_TASK_COLUMNS = (
+    Task.id,
+    Task.user_id,
+    Task.title,
+    Task.description,
+    Task.completed,
+    Task.created_at,
+    Task.updated_at,
+)
 
-@router.get("/{user_id}/tasks", dependencies=[Depends(verify_jwt_middleware)])
+# List statements are built once per filter so SQLAlchemy's compiled-
+# statement cache sees a stable cache key and always hits; the handler
+# just dispatches on the validated TaskFilter enum. Pages order by id
+# DESC - ids are serial, so this is newest-first like created_at but
+# strictly total, which the id-based keyset cursor requires (created_at
+# ties, e.g. rows from one batch INSERT, would make pages overlap).
+_LIST_STMTS = {
+    TaskFilter.all: (
+        select(*_TASK_COLUMNS)
+        .where(Task.user_id == bindparam("user_id"))
+        .order_by(Task.id.desc())
+    ),
+    TaskFilter.pending: (
+        select(*_TASK_COLUMNS)
+        .where(Task.user_id == bindparam("user_id"), Task.completed == False)
+        .order_by(Task.id.desc())
+    ),
+    TaskFilter.completed: (
+        select(*_TASK_COLUMNS)
+        .where(Task.user_id == bindparam("user_id"), Task.completed == True)
+        .order_by(Task.id.desc())
+    ),
+}
+
+
+@router.get("/tasks")
 async def list_tasks(
-    user_id: str,
     request: Request,
-    session: Session = Depends(get_session),
-    filter_status: str = "all"
-) -> ApiResponse:
+    session: AsyncSession = Depends(get_session),
+    filter_status: TaskFilter = TaskFilter.all,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = None
+):
     """
-    Get all tasks for authenticated user
+    Get tasks for authenticated user, one page at a time
 
     Args:
-        user_id: User ID from URL
         request: FastAPI request (contains authenticated user info)
         session: Database session
         filter_status: Filter by status (all, pending, completed)
+        limit: Maximum number of tasks per page
+        cursor: Task ID from a previous page; returns tasks older than it
 
     Returns:
-        ApiResponse with list of tasks
+        ApiResponse with a page of tasks and the cursor for the next page
     """
-    # Verify user_id matches authenticated user
-    if request.state.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot access other users' tasks"
-        )
+    # Authenticated user comes from the JWT via the auth middleware
+    user_id = request.state.user_id
 
-    # Build query
-    query = select(Task).where(Task.user_id == user_id)
+    # The default first page is the hot request, so serve it from
+    # Redis when a fresh copy exists; mutations invalidate these keys
+    cacheable = cursor is None and limit == 50
+    cache_key = task_list_key(user_id, filter_status.value)
+    if cacheable:
+        cached = await get_cached(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
 
-    if filter_status == "pending":
-        query = query.where(Task.completed == False)
-    elif filter_status == "completed":
-        query = query.where(Task.completed == True)
+    # Pick the prebuilt query for the requested filter
+    query = _LIST_STMTS[filter_status]
 
-    query = query.order_by(Task.created_at.desc())
+    # Keyset pagination: pages are ordered by id DESC, so "older than
+    # the last task seen" is just an id comparison
+    if cursor is not None:
+        query = query.where(Task.id < cursor)
+    query = query.limit(limit)
 
-    tasks = session.exec(query).all()
+    tasks = (await session.exec(query.params(user_id=user_id))).all()
 
-    return ApiResponse(
-        success=True,
-        data=[TaskResponse.model_validate(task).model_dump() for task in tasks]
-    )
+    next_cursor = tasks[-1].id if len(tasks) == limit else None
 
+    # Serialize once with orjson; the cached body is the exact bytes
+    # served on a hit
+    body = orjson.dumps({
+        "success": True,
+        "data": {
+            "tasks": [dict(row._mapping) for row in tasks],
+            "next_cursor": next_cursor
+        }
+    })
 
-@router.post(
-    "/{user_id}/tasks",
-    dependencies=[Depends(verify_jwt_middleware)],
-    status_code=status.HTTP_201_CREATED
-)
+    if cacheable:
+        await set_cached(cache_key, body)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/tasks", status_code=status.HTTP_201_CREATED)
 async def create_task(
-    user_id: str,
     task_data: TaskCreate,
     request: Request,
-    session: Session = Depends(get_session)
-) -> ApiResponse:
+    session: AsyncSession = Depends(get_session)
+):
     """
     Create a new task
 
     Args:
-        user_id: User ID from URL
         task_data: Task creation data
         request: FastAPI request
         session: Database session
@@ -77,43 +134,82 @@ async def create_task(
     Returns:
         ApiResponse with created task
     """
-    # Verify user_id matches authenticated user
-    if request.state.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot create tasks for other users"
+    # Authenticated user comes from the JWT via the auth middleware
+    user_id = request.state.user_id
+
+    # Create task with a single INSERT ... RETURNING round-trip
+    result = await session.exec(
+        insert(Task)
+        .values(
+            user_id=user_id,
+            title=task_data.title.strip(),
+            description=task_data.description.strip() if task_data.description else None,
+            completed=False
         )
-
-    # Create task
-    task = Task(
-        user_id=user_id,
-        title=task_data.title.strip(),
-        description=task_data.description.strip() if task_data.description else None,
-        completed=False
+        .returning(Task)
     )
+    task = result.scalar_one()
+    await session.commit()
+    await invalidate_task_lists(user_id)
+
+    return {"success": True, "data": _TASK_ADAPTER.dump_python(task)}
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
 
-    return ApiResponse(
-        success=True,
-        data=TaskResponse.model_validate(task).model_dump()
+@router.post("/tasks:batch", status_code=status.HTTP_201_CREATED)
+async def create_tasks_batch(
+    batch: List[TaskCreate],
+    request: Request,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Create multiple tasks in a single INSERT
+
+    Args:
+        batch: List of tasks to create
+        request: FastAPI request
+        session: Database session
+
+    Returns:
+        ApiResponse with the created tasks
+    """
+    # Authenticated user comes from the JWT via the auth middleware
+    user_id = request.state.user_id
+
+    if not batch:
+        return {"success": True, "data": {"tasks": []}}
+
+    # One multi-row INSERT ... RETURNING: a single round-trip and one
+    # commit regardless of batch size
+    result = await session.exec(
+        insert(Task)
+        .values([
+            {
+                "user_id": user_id,
+                "title": task_data.title.strip(),
+                "description": task_data.description.strip() if task_data.description else None,
+                "completed": False,
+            }
+            for task_data in batch
+        ])
+        .returning(Task)
     )
+    tasks = result.scalars().all()
+    await session.commit()
+    await invalidate_task_lists(user_id)
+
+    return {"success": True, "data": {"tasks": _TASK_LIST_ADAPTER.dump_python(tasks)}}
 
 
-@router.get("/{user_id}/tasks/{task_id}", dependencies=[Depends(verify_jwt_middleware)])
+@router.get("/tasks/{task_id}")
 async def get_task(
-    user_id: str,
     task_id: int,
     request: Request,
-    session: Session = Depends(get_session)
-) -> ApiResponse:
+    session: AsyncSession = Depends(get_session)
+):
     """
     Get task details
 
     Args:
-        user_id: User ID from URL
         task_id: Task ID
         request: FastAPI request
         session: Database session
@@ -121,40 +217,36 @@ async def get_task(
     Returns:
         ApiResponse with task details
     """
-    # Verify user_id matches authenticated user
-    if request.state.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot access other users' tasks"
-        )
+    # Authenticated user comes from the JWT via the auth middleware
+    user_id = request.state.user_id
 
-    task = session.get(Task, task_id)
+    # Fetch and ownership check in a single query
+    task = (
+        await session.exec(
+            select(Task).where(Task.id == task_id, Task.user_id == user_id)
+        )
+    ).first()
 
-    if not task or task.user_id != user_id:
+    if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    return ApiResponse(
-        success=True,
-        data=TaskResponse.model_validate(task).model_dump()
-    )
+    return {"success": True, "data": _TASK_ADAPTER.dump_python(task)}
 
 
-@router.put("/{user_id}/tasks/{task_id}", dependencies=[Depends(verify_jwt_middleware)])
+@router.put("/tasks/{task_id}")
 async def update_task(
-    user_id: str,
     task_id: int,
     task_data: TaskUpdate,
     request: Request,
-    session: Session = Depends(get_session)
-) -> ApiResponse:
+    session: AsyncSession = Depends(get_session)
+):
     """
     Update a task
 
     Args:
-        user_id: User ID from URL
         task_id: Task ID
         task_data: Task update data
         request: FastAPI request
@@ -163,51 +255,52 @@ async def update_task(
     Returns:
         ApiResponse with updated task
     """
-    # Verify user_id matches authenticated user
-    if request.state.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot update other users' tasks"
-        )
+    # Authenticated user comes from the JWT via the auth middleware
+    user_id = request.state.user_id
 
-    task = session.get(Task, task_id)
+    # Update fields; the ownership check is folded into the UPDATE's
+    # WHERE clause so the whole mutation is one round-trip. updated_at
+    # is maintained by the column's onupdate default.
+    values = {}
+    if task_data.title is not None:
+        values["title"] = task_data.title.strip()
+    if task_data.description is not None:
+        values["description"] = task_data.description.strip()
+    if not values:
+        # Nothing to change; still touch the row rather than compiling
+        # an UPDATE with no SET clause
+        values["updated_at"] = func.now()
+
+    result = await session.exec(
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(**values)
+        .returning(Task)
+    )
+    task = result.scalar_one_or_none()
 
-    if not task or task.user_id != user_id:
+    if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    # Update fields
-    if task_data.title is not None:
-        task.title = task_data.title.strip()
-    if task_data.description is not None:
-        task.description = task_data.description.strip()
-
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    await session.commit()
+    await invalidate_task_lists(user_id)
 
-    return ApiResponse(
-        success=True,
-        data=TaskResponse.model_validate(task).model_dump()
-    )
+    return {"success": True, "data": _TASK_ADAPTER.dump_python(task)}
 
 
-@router.delete("/{user_id}/tasks/{task_id}", dependencies=[Depends(verify_jwt_middleware)])
+@router.delete("/tasks/{task_id}")
 async def delete_task(
-    user_id: str,
     task_id: int,
     request: Request,
-    session: Session = Depends(get_session)
-) -> ApiResponse:
+    session: AsyncSession = Depends(get_session)
+):
     """
     Delete a task
 
     Args:
-        user_id: User ID from URL
         task_id: Task ID
         request: FastAPI request
         session: Database session
@@ -215,42 +308,38 @@ async def delete_task(
     Returns:
         ApiResponse with success message
     """
-    # Verify user_id matches authenticated user
-    if request.state.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot delete other users' tasks"
-        )
-
-    task = session.get(Task, task_id)
+    # Authenticated user comes from the JWT via the auth middleware
+    user_id = request.state.user_id
+
+    # Delete and ownership check in a single round-trip
+    result = await session.exec(
+        delete(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .returning(Task.id)
+    )
 
-    if not task or task.user_id != user_id:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    session.delete(task)
-    session.commit()
+    await session.commit()
+    await invalidate_task_lists(user_id)
 
-    return ApiResponse(
-        success=True,
-        data={"message": "Task deleted successfully"}
-    )
+    return {"success": True, "data": {"message": "Task deleted successfully"}}
 
 
-@router.patch("/{user_id}/tasks/{task_id}/complete", dependencies=[Depends(verify_jwt_middleware)])
+@router.patch("/tasks/{task_id}/complete")
 async def toggle_task_completion(
-    user_id: str,
     task_id: int,
     request: Request,
-    session: Session = Depends(get_session)
-) -> ApiResponse:
+    session: AsyncSession = Depends(get_session)
+):
     """
     Toggle task completion status
 
     Args:
-        user_id: User ID from URL
         task_id: Task ID
         request: FastAPI request
         session: Database session
@@ -258,29 +347,26 @@ async def toggle_task_completion(
     Returns:
         ApiResponse with updated task
     """
-    # Verify user_id matches authenticated user
-    if request.state.user_id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot update other users' tasks"
-        )
-
-    task = session.get(Task, task_id)
+    # Authenticated user comes from the JWT via the auth middleware
+    user_id = request.state.user_id
+
+    # Flip the flag in the database so the read, ownership check and
+    # write all happen in a single round-trip
+    result = await session.exec(
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(completed=~Task.completed)
+        .returning(Task)
+    )
+    task = result.scalar_one_or_none()
 
-    if not task or task.user_id != user_id:
+    if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    task.completed = not task.completed
-    task.updated_at = datetime.utcnow()
+    await session.commit()
+    await invalidate_task_lists(user_id)
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
-
-    return ApiResponse(
-        success=True,
-        data=TaskResponse.model_validate(task).model_dump()
-    )
+    return {"success": True, "data": _TASK_ADAPTER.dump_python(task)}
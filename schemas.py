@@ -1,8 +1,16 @@
+from enum import Enum
 from pydantic import BaseModel, Field
 from typing import Optional, Any
 from datetime import datetime
 
 
+class TaskFilter(str, Enum):
+    """Task list filter, validated by FastAPI at query-param parse time"""
+    all = "all"
+    pending = "pending"
+    completed = "completed"
+
+
 class TaskCreate(BaseModel):
     """Schema for creating a new task"""
     title: str = Field(..., min_length=1, max_length=200)
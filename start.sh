@@ -0,0 +1,8 @@
+#!/bin/sh
+# Production start script: one uvicorn worker per CPU core under
+# gunicorn. Override worker count with WEB_CONCURRENCY.
+exec gunicorn main:app \
+    -k uvicorn.workers.UvicornWorker \
+    --workers "${WEB_CONCURRENCY:-$(nproc)}" \
+    --worker-connections 1000 \
+    --bind "0.0.0.0:${PORT:-8000}"
@@ -1,6 +1,8 @@
 import jwt
+import hashlib
 import os
-from datetime import datetime
+import time
+from jwt.algorithms import get_default_algorithms
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -12,6 +14,26 @@ SECRET_KEY = os.getenv("BETTER_AUTH_SECRET")
 if not SECRET_KEY:
     raise ValueError("BETTER_AUTH_SECRET environment variable is not set")
 
+# Short-lived cache of verified payloads so replayed tokens skip the
+# HMAC signature check. Keyed on a SHA-256 of the token (not the raw
+# token) to bound memory.
+_CACHE_TTL = 60  # seconds
+_CACHE_MAX_ENTRIES = 1024
+_payload_cache: dict[str, tuple[float, dict]] = {}
+
+# Decoder instance and options are built once at import; PyJWT
+# enforces exp itself (raising ExpiredSignatureError), so no manual
+# expiry check is needed on the decode path.
+_JWT = jwt.PyJWT()
+_JWT_OPTIONS = {"require": ["exp", "sub"], "verify_exp": True}
+_ALGORITHMS = ["HS256"]
+
+# Key material is prepared once at import; passing bytes means PyJWT's
+# HMAC algorithm doesn't re-encode the secret on every decode.
+_SIGNING_KEY = get_default_algorithms()["HS256"].prepare_key(
+    SECRET_KEY.encode("utf-8")
+)
+
 
 def verify_jwt(token: str) -> Optional[dict]:
     """
@@ -23,20 +45,36 @@ def verify_jwt(token: str) -> Optional[dict]:
     Returns:
         Decoded payload if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    now = time.time()
+    cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
 
-        # Check expiration
-        exp = payload.get("exp")
-        if exp and datetime.fromtimestamp(exp) < datetime.utcnow():
-            return None
+    cached = _payload_cache.get(cache_key)
+    if cached:
+        cached_at, payload = cached
+        if now - cached_at < _CACHE_TTL:
+            # Still re-check expiry: the token may have expired
+            # within the cache window.
+            exp = payload.get("exp")
+            if exp and exp < now:
+                return None
+            return payload
+        del _payload_cache[cache_key]
 
-        return payload
+    try:
+        payload = _JWT.decode(
+            token, _SIGNING_KEY, algorithms=_ALGORITHMS, options=_JWT_OPTIONS
+        )
     except jwt.InvalidTokenError:
         return None
     except Exception:
         return None
 
+    if len(_payload_cache) >= _CACHE_MAX_ENTRIES:
+        _payload_cache.clear()
+    _payload_cache[cache_key] = (now, payload)
+
+    return payload
+
 
 def get_user_id_from_token(token: str) -> Optional[str]:
     """